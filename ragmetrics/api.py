@@ -218,9 +218,9 @@ def trace_function_call(func):
         Callable: A wrapped version of the function that logs execution details.
     """
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
 
         # Format parameters in the requested format
         params = []
@@ -301,6 +301,10 @@ class RagMetricsClient:
         self.metadata = None
         self.conversation_id = self.new_conversation()
         self.callback = None
+        # Default timeout (seconds) for API requests; None waits indefinitely
+        self.request_timeout = None
+        # Reuse one HTTP connection pool across API calls
+        self._session = requests.Session()
     
     def new_conversation(self, id: Optional[str] = None):
         """
@@ -702,7 +706,7 @@ class RagMetricsClient:
         expected = kwargs.pop('expected', None)
         
         # Execute client-specific generation
-        start_time = time.time()
+        start_time = time.perf_counter()
         if client_type == 'openai':
             client, self_instance, *invoke_args = args
             response = orig_invoke(self_instance, *invoke_args, **kwargs)
@@ -727,7 +731,7 @@ class RagMetricsClient:
         else:
             response = orig_invoke(*args, **kwargs)
 
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
 
         # Process and log the interaction
         input_messages = \
@@ -809,13 +813,15 @@ class RagMetricsClient:
             endpoint: The API endpoint to call (e.g., "/api/client/login/").
             method: The HTTP method to use (default: "post").
             **kwargs: Additional arguments to pass to the requests library.
+                     If no timeout is given, request_timeout is used.
 
     
     Returns:
             Response: The HTTP response from the API.
         """
         url = f"{self.base_url}{endpoint}"
-        response = requests.request(method, url, **kwargs)
+        kwargs.setdefault("timeout", self.request_timeout)
+        response = self._session.request(method, url, **kwargs)
         return response
 
 class RagMetricsObject:
@@ -753,7 +753,6 @@ class Experiment:
         print(f'Experiment "{self.name}" is running. Check progress at: {base_url}{results_url}')
         
         headers = {"Authorization": f"Token {ragmetrics_client.access_token}"}
-        progress_url = f"{base_url}/api/experiment/progress/{experiment_run_id}/"
         
         with tqdm(total=100, desc="Progress", bar_format="{l_bar}{bar}| {n_fmt}%[{elapsed}<{remaining}]") as pbar:
             last_progress = 0
@@ -761,7 +760,12 @@ class Experiment:
             
             while True:
                 try:
-                    response = requests.get(progress_url, headers=headers, timeout=10)
+                    response = ragmetrics_client._make_request(
+                        endpoint=f"/api/experiment/progress/{experiment_run_id}/",
+                        method="get",
+                        headers=headers,
+                        timeout=10
+                    )
                     response.raise_for_status()
                     progress_data = response.json()
                     
@@ -1,25 +1,28 @@
+import pytest
 import ragmetrics
-from agents import Agent, Runner, function_tool
 
-#load .env
-from dotenv import load_dotenv
-load_dotenv('.env')
+@pytest.mark.requires_live
+@pytest.mark.requires_sdk("agents")
+@pytest.mark.requires_openai_key
+def test_openai_agent_weather(ragmetrics_test_client):
+    # Import the Agents SDK here so collection does not pay for it
+    from agents import Agent, Runner, function_tool
 
-# 1. Configure RagMetrics and monitor the agents Runner
-ragmetrics.login()
-ragmetrics.monitor(Runner)
+    # 1. Monitor the agents Runner with the session's logged-in client
+    ragmetrics.monitor(Runner)
 
-# 2. Define your tools and agents as usual
-@function_tool
-def get_weather(city: str) -> str:
-    return f"Sunny."
+    # 2. Define your tools and agents as usual
+    @function_tool
+    def get_weather(city: str) -> str:
+        return f"Sunny."
 
-agent = Agent(
-    name="WeatherAgent",
-    instructions="Answer weather queries in full sentences, repeat the city name",
-    tools=[get_weather]
-)
+    agent = Agent(
+        name="WeatherAgent",
+        instructions="Answer weather queries in full sentences, repeat the city name",
+        tools=[get_weather]
+    )
 
-# 3. Run the agent; RagMetrics will capture the trace
-result = Runner.run_sync(agent, "What's the weather in Berlin?")
-print(result.final_output)
+    # 3. Run the agent; RagMetrics will capture the trace
+    result = Runner.run_sync(agent, "What's the weather in Berlin?")
+    print(result.final_output)
+    assert "Berlin" in result.final_output
@@ -5,10 +5,6 @@ import ragmetrics
 from dotenv import load_dotenv
 load_dotenv('.env')
 
-# 1. Configure RagMetrics and monitor the agents Runner
-ragmetrics.login()
-ragmetrics.monitor(Runner)
-
 """
 This example demonstrates a deterministic flow, where each step is performed by an agent.
 1. The first agent generates a story outline
@@ -44,6 +40,10 @@ story_agent = Agent(
 
 
 def main():
+    # Configure RagMetrics and monitor the agents Runner
+    ragmetrics.login()
+    ragmetrics.monitor(Runner)
+
     input_prompt = input("What kind of story do you want? ")
 
     # Ensure the entire workflow is a single trace
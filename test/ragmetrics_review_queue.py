@@ -1,49 +1,54 @@
+import itertools
+from types import SimpleNamespace
 import ragmetrics
-from datasets import load_dataset
+from ragmetrics.reviews import ReviewQueue
 from dotenv import load_dotenv
-load_dotenv(".env")
 
 task_name = "halu_eval_v6"
 
-#Set up the RAGMetrics client
-class StubLLMClient:
-    """A mock LLM client. Takes input and output. Returns the output."""
-    def invoke(self, *args, **kwargs):
-        return kwargs.get('output')
-
-ragmetrics.login()
-stub_client = StubLLMClient()
-ragmetrics.monitor(stub_client, metadata={"task": task_name})
-
-
-#Load the Halu-eval dataset (https://github.com/RUCAIBox/HaluEval)
-halu_eval_qa = load_dataset("pminervini/HaluEval", name="qa")
-dataset = halu_eval_qa['data']
-
-#Log traces, top 2 only
-topX = 2
-dataset_topX = list(dataset)[:topX]
-
-for i, example in enumerate(dataset_topX):
-    print(f"Logging example {i+1} of {topX}")
-    input = f"Question: {example['question']}\n\n"
-    input += f"Knowledge: {example['knowledge']}"
-    output = example["hallucinated_answer"]
-    expected = example["right_answer"]
-
-    resp = stub_client.invoke(
-        input=input,
-        output=output,
-        expected=expected
+def load_halu_eval(topX):
+    """Stream the first topX examples of the Halu-eval QA split (https://github.com/RUCAIBox/HaluEval)."""
+    # Imported here: datasets pulls in pyarrow/pandas, which is only needed when we actually load data
+    from datasets import load_dataset
+    halu_eval_qa = load_dataset("pminervini/HaluEval", name="qa", split="data", streaming=True)
+    return list(itertools.islice(halu_eval_qa, topX))
+
+def main():
+    load_dotenv(".env")
+
+    #Set up the RAGMetrics client
+    #A mock LLM client. Takes input and output. Returns the output.
+    stub_client = SimpleNamespace(invoke=lambda *args, **kwargs: kwargs.get('output'))
+
+    ragmetrics.login()
+    ragmetrics.monitor(stub_client, metadata={"task": task_name})
+
+    #Log traces, top 2 only
+    topX = 2
+    dataset_topX = load_halu_eval(topX)
+
+    for i, example in enumerate(dataset_topX):
+        print(f"Logging example {i+1} of {topX}")
+        input = f"Question: {example['question']}\n\n"
+        input += f"Knowledge: {example['knowledge']}"
+        output = example["hallucinated_answer"]
+        expected = example["right_answer"]
+
+        resp = stub_client.invoke(
+            input=input,
+            output=output,
+            expected=expected
+        )
+
+    # Create a review retroactive review queue
+    rq = ReviewQueue(
+        name=task_name,
+        condition=task_name,
+        criteria=["Accuracy"],
+        judge_model="o3-mini",
+        retroactive=True # Apply to existing traces
     )
+    rq.save()
 
-# Create a review retroactive review queue
-from ragmetrics.reviews import ReviewQueue
-rq = ReviewQueue(
-    name=task_name,
-    condition=task_name,
-    criteria=["Accuracy"],
-    judge_model="o3-mini",
-    retroactive=True # Apply to existing traces
-)
-rq.save()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,7 @@
-import os
-import time
-from dotenv import load_dotenv
+import pytest
 
-import ragmetrics
 from ragmetrics import Task, Example, Dataset, Experiment, Criteria
 
-# Load environment variables
-load_dotenv(".env")
-
-# Get environment variables
-api_key = os.environ.get('RAGMETRICS_API_KEY')
-base_url = os.environ.get('RAGMETRICS_BASE_URL')
-
-# Login to ragmetrics
-ragmetrics.login(key=api_key, base_url=base_url)
-
 def local_function(input, cohort = None):
     answer = f"Reflect input: {input}"
     contexts = [
@@ -28,22 +15,27 @@ def local_function(input, cohort = None):
     
     return output_json
 
-e1 = Example(question="Alice", ground_truth_answer="Reflect input: Alice")
-e2 = Example(question="Bob", ground_truth_answer="Reflect input: Bob")
-dataset1 = Dataset(examples = [e1, e2], name="Names")
-task1 = Task(name="Reflect", function=local_function)
-criteria1 = Criteria(name = "Accuracy")
-criteria2 = Criteria(name = "Context Relevance")
-
-exp1 = Experiment(
-            name="Generation and Retrieval",
-            dataset=dataset1,
-            task=task1,
-            criteria=[criteria1, criteria2],                
-            #criteria=[criteria2],
-            judge_model="gpt-4o-mini"
-        )
-status = exp1.run()
-
-assert status.get("state") == "SUCCESS", \
-    f"Expected state 'SUCCESS', got: {status.get('state')}"
\ No newline at end of file
+@pytest.mark.slow
+@pytest.mark.requires_live
+def test_local_function_2x2(ragmetrics_test_client):
+    # Login comes from the ragmetrics_test_client fixture
+    # (RAGMETRICS_API_KEY / RAGMETRICS_BASE_URL)
+    e1 = Example(question="Alice", ground_truth_answer="Reflect input: Alice")
+    e2 = Example(question="Bob", ground_truth_answer="Reflect input: Bob")
+    dataset1 = Dataset(examples = [e1, e2], name="Names")
+    task1 = Task(name="Reflect", function=local_function)
+    criteria1 = Criteria(name = "Accuracy")
+    criteria2 = Criteria(name = "Context Relevance")
+
+    exp1 = Experiment(
+                name="Generation and Retrieval",
+                dataset=dataset1,
+                task=task1,
+                criteria=[criteria1, criteria2],                
+                #criteria=[criteria2],
+                judge_model="gpt-4o-mini"
+            )
+    status = exp1.run()
+
+    assert status.get("state") == "SUCCESS", \
+        f"Expected state 'SUCCESS', got: {status.get('state')}"
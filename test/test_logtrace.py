@@ -1,20 +1,16 @@
 #!pip install ragmetrics-client
 #!pip install openai litellm langchain_groq
 
+import pytest
 import ragmetrics
-from openai import OpenAI
-import litellm
-from langchain_groq import ChatGroq
-import os
-from dotenv import load_dotenv
-load_dotenv(".env")
 
 # os.environ['RAGMETRICS_API_KEY'] = 'your_ragmetrics_key'
 # os.environ['GROQ_API_KEY'] = 'your_groq_key'
 # os.environ['OPENAI_API_KEY'] = 'your_openai_key'
 
-# Login with the API key from environment
-ragmetrics.login()
+# The ragmetrics_test_client fixture logs in with the API key from environment
+# Provider SDKs are imported inside each test so collection does not pay for them;
+# requires_sdk skips a test at collection time when its SDK is not installed
 
 def create_messages(client_name, country):
     return [
@@ -31,35 +27,56 @@ def my_callback(raw_input, raw_output):
     }
     return processed
 
-# Test OpenAI client (chat-based)
-openai_client = OpenAI()
-ragmetrics.monitor(openai_client, metadata={"client": "openai"})
-messages = create_messages("OpenAI", "France")
-resp = openai_client.chat.completions.create(
-    model="gpt-3.5-turbo",
-    messages=messages,
-    metadata={"client": "OpenAI Native", "step": 1},
-    contexts=["sample context 1", "sample context 2"]
-)
-print(resp)
+@pytest.mark.requires_live
+@pytest.mark.requires_sdk("openai")
+@pytest.mark.requires_openai_key
+def test_openai_logtrace(ragmetrics_test_client, set_client_metadata):
+    from openai import OpenAI
 
-# Test LiteLLM client (module-level function)
-ragmetrics.monitor(litellm, metadata={"client": "litellm"})
-messages = create_messages("LiteLLM", "Germany")
-resp = litellm.completion(
-    model="gpt-3.5-turbo",
-    messages=messages,
-    metadata={"task": "test", "step": "litellm"}
-)
-print(resp)
+    # Test OpenAI client (chat-based)
+    with set_client_metadata(None):
+        openai_client = OpenAI()
+        ragmetrics.monitor(openai_client, metadata={"client": "openai"})
+        messages = create_messages("OpenAI", "France")
+        resp = openai_client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=messages,
+            metadata={"client": "OpenAI Native", "step": 1},
+            contexts=["sample context 1", "sample context 2"]
+        )
+        assert resp.choices[0].message.content
 
-# Test LangChain-style client
-ragmetrics.monitor(ChatGroq, metadata={"client": "langchain"}, callback=my_callback)
-langchain_model = ChatGroq(model="llama3-8b-8192")
-messages = create_messages("LangChain", "Italy")
-resp = langchain_model.invoke(
-    model="llama3-8b-8192",
-    input=messages,
-    metadata={"task": "test", "step": "langchain"}
-)
-print(resp)
+@pytest.mark.requires_live
+@pytest.mark.requires_sdk("litellm")
+@pytest.mark.requires_openai_key
+def test_litellm_logtrace(ragmetrics_test_client, set_client_metadata):
+    import litellm
+
+    # Test LiteLLM client (module-level function)
+    with set_client_metadata(None):
+        ragmetrics.monitor(litellm, metadata={"client": "litellm"})
+        messages = create_messages("LiteLLM", "Germany")
+        resp = litellm.completion(
+            model="gpt-3.5-turbo",
+            messages=messages,
+            metadata={"task": "test", "step": "litellm"}
+        )
+        assert resp.choices[0].message.content
+
+@pytest.mark.requires_live
+@pytest.mark.requires_sdk("langchain_groq")
+@pytest.mark.requires_groq_key
+def test_langchain_logtrace(ragmetrics_test_client, set_client_metadata):
+    from langchain_groq import ChatGroq
+
+    # Test LangChain-style client
+    with set_client_metadata(None):
+        ragmetrics.monitor(ChatGroq, metadata={"client": "langchain"}, callback=my_callback)
+        langchain_model = ChatGroq(model="llama3-8b-8192")
+        messages = create_messages("LangChain", "Italy")
+        resp = langchain_model.invoke(
+            model="llama3-8b-8192",
+            input=messages,
+            metadata={"task": "test", "step": "langchain"}
+        )
+        assert resp.content
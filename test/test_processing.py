@@ -0,0 +1,78 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from ragmetrics.api import default_input, default_output, default_callback
+
+# Offline checks of how raw LLM inputs and responses are turned into trace fields
+
+TOOL_ARGUMENTS = json.dumps({"city": "London", "days": 3})
+EXPECTED_TOOL_OUTPUT = "=get_weather(city='London', days=3)"
+
+def chat_response(content=None, tool_calls=None):
+    """OpenAI ChatCompletion-shaped response object"""
+    message = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+def tool_call_object(name="get_weather", arguments=TOOL_ARGUMENTS):
+    return SimpleNamespace(type="function", function=SimpleNamespace(name=name, arguments=arguments))
+
+@pytest.mark.parametrize("raw_input,expected", [
+    pytest.param([{"role": "system", "content": "Be brief."}, {"role": "user", "content": "Hi"}], "Hi", id="message-list"),
+    pytest.param({"role": "user", "content": "Hi"}, "Hi", id="message-dict"),
+    pytest.param(SimpleNamespace(role="user", content="Hi"), "Hi", id="message-object"),
+    pytest.param({"type": "function_call_output", "call_id": "c1", "output": "21.5"}, "21.5", id="function-call-output"),
+    pytest.param("plain prompt", "plain prompt", id="string"),
+    pytest.param(42, "42", id="primitive"),
+])
+def test_default_input(raw_input, expected):
+    assert default_input(raw_input) == expected
+
+@pytest.mark.parametrize("raw_response,expected", [
+    pytest.param(None, None, id="empty"),
+    pytest.param(chat_response(content="Paris"), "Paris", id="chat-content"),
+    pytest.param(chat_response(tool_calls=[tool_call_object()]), EXPECTED_TOOL_OUTPUT, id="chat-tool-call-object"),
+    pytest.param(
+        {"choices": [{"message": {"content": None, "tool_calls": [
+            {"type": "function", "function": {"name": "get_weather", "arguments": TOOL_ARGUMENTS}}
+        ]}}]},
+        EXPECTED_TOOL_OUTPUT,
+        id="chat-tool-call-dict",
+    ),
+    pytest.param(
+        {"type": "SpanImpl", "span_data": {"type": "response", "response": {"output": [
+            {"type": "function_call", "name": "get_weather", "arguments": TOOL_ARGUMENTS},
+        ]}}},
+        EXPECTED_TOOL_OUTPUT,
+        id="agents-function-call",
+    ),
+    pytest.param(
+        {"type": "SpanImpl", "span_data": {"type": "function", "output": "21.5"}},
+        "21.5",
+        id="agents-tool-response",
+    ),
+    pytest.param(
+        {"type": "SpanImpl", "span_data": {"type": "response", "response": {"output": [
+            {"type": "message", "role": "assistant", "content": [{"type": "output_text", "text": "It is sunny."}]},
+        ]}}},
+        "It is sunny.",
+        id="agents-assistant-message",
+    ),
+    pytest.param(
+        {"type": "SpanImpl", "span_data": {"type": "agent", "name": "WeatherAgent"}},
+        "Agent: WeatherAgent Completed",
+        id="agents-agent-span",
+    ),
+    pytest.param(SimpleNamespace(content="Ciao"), "Ciao", id="langchain-message"),
+    pytest.param("raw text", "raw text", id="string"),
+])
+def test_default_output(raw_response, expected):
+    assert default_output(raw_response) == expected
+
+def test_default_callback():
+    raw_input = [{"role": "user", "content": "Capital of France?"}]
+    assert default_callback(raw_input, chat_response(content="Paris")) == {
+        "input": "Capital of France?",
+        "output": "Paris",
+    }
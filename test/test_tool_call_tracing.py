@@ -1,18 +1,12 @@
-import sys
-import os
 import json
+from types import SimpleNamespace
+
+import pytest
 import requests
-from dotenv import load_dotenv
 
-import ragmetrics
 from ragmetrics import trace_function_call
-from openai import OpenAI
-
-# Load environment variables from .env file
-load_dotenv(".env")
 
-# Login to RagMetrics - either with explicit key or from environment
-ragmetrics.login()
+# The ragmetrics_test_client fixture logs in with the API key from environment
 
 # Example 1: Weather API function
 @trace_function_call
@@ -27,12 +21,14 @@ def get_weather(latitude, longitude):
     data = response.json()
     return data['current']['temperature_2m']
 
-# Run the test functions
-# OpenAI function calling (tool use)
-client = OpenAI()
-ragmetrics.monitor(client)
+@pytest.fixture
+def mock_weather(monkeypatch):
+    """Serve a canned open-meteo response so the tool call needs no external HTTP"""
+    def fake_get(url, *args, **kwargs):
+        return SimpleNamespace(status_code=200, json=lambda: {"current": {"temperature_2m": 21.5}})
+    monkeypatch.setattr(requests, "get", fake_get)
 
-tools = [
+TOOLS = [
     {
         "type": "function",
         "function": {
@@ -50,27 +46,36 @@ tools = [
     }
 ]
 
-messages = [{"role": "user", "content": "What's the weather like in San Francisco?"}]
+@pytest.mark.requires_live
+@pytest.mark.requires_sdk("openai")
+@pytest.mark.requires_openai_key
+def test_tool_call_flow(ragmetrics_test_client, monitored_openai_client, mock_weather):
+    # OpenAI function calling (tool use)
+    client = monitored_openai_client
+    messages = [{"role": "user", "content": "What's the weather like in San Francisco?"}]
 
-completion = client.chat.completions.create(
-    model="gpt-4o-mini",
-    messages=messages,
-    tools=tools,
-    tool_choice="auto"
-)
+    completion = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=messages,
+        tools=TOOLS,
+        tool_choice="auto"
+    )
 
-tool_call = completion.choices[0].message.tool_calls[0]
-args = json.loads(tool_call.function.arguments)
-result = get_weather(**args)
+    tool_call = completion.choices[0].message.tool_calls[0]
+    assert tool_call.function.name == "get_weather"
+    args = json.loads(tool_call.function.arguments)
+    result = get_weather(**args)
+    assert result == 21.5
 
-messages.append(completion.choices[0].message)  # append model's function call message
-messages.append({                               # append result message
-    "role": "tool",
-    "tool_call_id": tool_call.id,
-    "content": str(result)
-})
+    messages.append(completion.choices[0].message)  # append model's function call message
+    messages.append({                               # append result message
+        "role": "tool",
+        "tool_call_id": tool_call.id,
+        "content": str(result)
+    })
 
-second_completion = client.chat.completions.create(
-    model="gpt-4o-mini",
-    messages=messages
-)    
\ No newline at end of file
+    second_completion = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=messages
+    )
+    assert second_completion.choices[0].message.content